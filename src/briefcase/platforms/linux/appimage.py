@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 import subprocess
 from collections.abc import Collection
+from functools import cached_property
+from itertools import chain
 
 from briefcase.commands import (
     BuildCommand,
@@ -28,6 +30,101 @@ from briefcase.platforms.linux import (
     LocalRequirementsMixin,
 )
 
+_LOCAL_APPIMAGE_WARNING = """\
+*************************************************************************
+** WARNING: Building a Local AppImage!                                 **
+*************************************************************************
+
+    You are building an AppImage outside Docker. The resulting AppImage
+    will work, but will not be as portable as a Docker-based AppImage.
+    Any `manylinux` setting will be ignored.
+
+*************************************************************************
+"""
+
+_APPIMAGE_DEPRECATION_WARNING = """\
+*************************************************************************
+** WARNING: Use of AppImage is not recommended!                        **
+*************************************************************************
+
+    Briefcase supports AppImage in a best-effort capacity. It has proven
+    to be highly unreliable as a distribution platform. AppImages cannot
+    use pre-compiled binary wheels, and has significant problems with
+    most commonly used GUI toolkits (including GTK and PySide).
+
+    Consider using system packages or Flatpak for Linux app
+    distribution.
+
+*************************************************************************
+"""
+
+_SUPPORT_PACKAGE_UPDATE_WARNING = """
+*************************************************************************
+** WARNING: Support package update may be imperfect                    **
+*************************************************************************
+
+    Support packages in Linux AppImages are overlaid with app content,
+    so it isn't possible to remove all old support files before
+    installing new ones.
+
+    Briefcase will unpack the new support package without cleaning up
+    existing support package content. This *should* work; however,
+    ensure a reproducible release artefacts, it is advisable to
+    perform a clean app build before release.
+
+*************************************************************************
+"""
+
+# The manylinux architecture label for each linuxdeploy architecture that has
+# a manylinux base image.
+_MANYLINUX_ARCH = {
+    "x86_64": "x86_64",
+    "i386": "i686",
+    "aarch64": "aarch64",
+}
+
+# The Docker vendor base image associated with each known manylinux tag.
+# Tags matching manylinux_2_* (other than manylinux_2_24) are almalinux-based.
+_VENDOR_BASE = {
+    "manylinux1": "centos",
+    "manylinux2010": "centos",
+    "manylinux2014": "centos",
+    "manylinux_2_24": "debian",
+}
+
+
+def _so_folders(root) -> list[str]:
+    """Find the folders in a directory tree that contain ``.so`` files.
+
+    An iterative ``os.scandir()`` walk is used instead of ``Path.glob("**/*.so")``;
+    this avoids instantiating (and stat-ing) a ``Path`` object for every file in
+    the tree, which can contain tens of thousands of entries in an AppDir with a
+    bundled support package.
+
+    :param root: The root of the directory tree to search.
+    :returns: A sorted list of paths (as strings) of folders containing ``.so``
+        files. Sorting string paths (rather than ``Path`` objects) keeps the
+        build deterministic without the per-comparison cost of ``Path`` ordering.
+    """
+    # The root may not exist (e.g., a stale bundle whose AppDir has been
+    # removed); as with glob(), this yields no folders.
+    if not os.path.isdir(root):
+        return []
+
+    # A dict is used as a deduplicating, insertion-ordered container; a folder
+    # with multiple .so files is only recorded once.
+    folders = {}
+    stack = [os.fspath(root)]
+    while stack:
+        path = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".so"):
+                    folders[path] = None
+    return sorted(folders)
+
 
 class LinuxAppImagePassiveMixin(LinuxMixin):
     # The Passive mixin honors the docker options, but doesn't try to verify
@@ -40,6 +137,15 @@ class LinuxAppImagePassiveMixin(LinuxMixin):
     )
     platform_target_version: str | None = "0.3.20"
 
+    @cached_property
+    def _arch(self):
+        """The architecture defined by linuxdeploy for AppImages.
+
+        Commands are short-lived objects, and the architecture can't change mid-
+        command, so the value is cached to avoid repeated tool lookups.
+        """
+        return LinuxDeploy.arch(self.tools)
+
     def appdir_path(self, app):
         return self.bundle_path(app) / f"{app.formal_name}.AppDir"
 
@@ -48,8 +154,7 @@ class LinuxAppImagePassiveMixin(LinuxMixin):
 
     def binary_name(self, app):
         safe_name = app.formal_name.replace(" ", "_")
-        arch = LinuxDeploy.arch(self.tools)
-        return f"{safe_name}-{app.version}-{arch}.AppImage"
+        return f"{safe_name}-{app.version}-{self._arch}.AppImage"
 
     def binary_path(self, app):
         return self.bundle_path(app) / self.binary_name(app)
@@ -58,9 +163,15 @@ class LinuxAppImagePassiveMixin(LinuxMixin):
         return self.dist_path / self.binary_name(app)
 
     def verify_tools(self):
-        """Verify the AppImage LinuxDeploy tool and its plugins exist."""
+        """Verify the AppImage LinuxDeploy tool and its plugins exist.
+
+        Verification is only performed once per tool cache; when multiple commands share
+        a process (e.g., build invoking create), the repeat verifications are no-ops.
+        """
         super().verify_tools()
-        LinuxDeploy.verify(tools=self.tools)
+        if not getattr(self.tools, "_linuxdeploy_verified", False):
+            LinuxDeploy.verify(tools=self.tools)
+            self.tools._linuxdeploy_verified = True
 
     def add_options(self, parser):
         super().add_options(parser)
@@ -95,33 +206,9 @@ class LinuxAppImagePassiveMixin(LinuxMixin):
     def finalize_app_config(self, app: DraftAppConfig, **kwargs) -> FinalizedAppConfig:
         """If we're *not* using Docker, warn the user about portability."""
         if not self.use_docker:
-            self.console.warning("""\
-*************************************************************************
-** WARNING: Building a Local AppImage!                                 **
-*************************************************************************
-
-    You are building an AppImage outside Docker. The resulting AppImage
-    will work, but will not be as portable as a Docker-based AppImage.
-    Any `manylinux` setting will be ignored.
-
-*************************************************************************
-""")
-
-        self.console.warning("""\
-*************************************************************************
-** WARNING: Use of AppImage is not recommended!                        **
-*************************************************************************
+            self.console.warning(_LOCAL_APPIMAGE_WARNING)
 
-    Briefcase supports AppImage in a best-effort capacity. It has proven
-    to be highly unreliable as a distribution platform. AppImages cannot
-    use pre-compiled binary wheels, and has significant problems with
-    most commonly used GUI toolkits (including GTK and PySide).
-
-    Consider using system packages or Flatpak for Linux app
-    distribution.
-
-*************************************************************************
-""")
+        self.console.warning(_APPIMAGE_DEPRECATION_WARNING)
         return super().finalize_app_config(app, **kwargs)
 
 
@@ -129,17 +216,32 @@ class LinuxAppImageMostlyPassiveMixin(LinuxAppImagePassiveMixin):
     # The Mostly Passive mixin verifies that Docker exists and can be run, but
     # doesn't require that we're actually in a Linux environment.
     def docker_image_tag(self, app):
-        """The Docker image tag for an app."""
-        try:
-            return f"briefcase/{app.bundle_identifier.lower()}:{app.manylinux}-appimage"
-        except AttributeError:
-            return f"briefcase/{app.bundle_identifier.lower()}:appimage"
+        """The Docker image tag for an app.
+
+        The tag is cached on the app config; it is derived from properties that don't
+        change over the lifetime of a command.
+        """
+        tag = getattr(app, "_docker_image_tag", None)
+        if tag is None:
+            try:
+                tag = (
+                    f"briefcase/{app.bundle_identifier.lower()}"
+                    f":{app.manylinux}-appimage"
+                )
+            except AttributeError:
+                tag = f"briefcase/{app.bundle_identifier.lower()}:appimage"
+            app._docker_image_tag = tag
+        return tag
 
     def verify_tools(self):
-        """If we're using docker, verify that it is available."""
+        """If we're using docker, verify that it is available.
+
+        As with linuxdeploy, Docker is only verified once per tool cache.
+        """
         super().verify_tools()
-        if self.use_docker:
+        if self.use_docker and not getattr(self.tools, "_docker_verified", False):
             Docker.verify(tools=self.tools)
+            self.tools._docker_verified = True
 
     def verify_app_tools(self, app: FinalizedAppConfig):
         """Verify App environment is prepared and available.
@@ -187,13 +289,9 @@ class LinuxAppImageCreateCommand(
         context = super().output_format_template_context(app)
 
         try:
-            manylinux_arch = {
-                "x86_64": "x86_64",
-                "i386": "i686",
-                "aarch64": "aarch64",
-            }[LinuxDeploy.arch(self.tools)]
+            manylinux_arch = _MANYLINUX_ARCH[self._arch]
         except KeyError:
-            manylinux_arch = LinuxDeploy.arch(self.tools)
+            manylinux_arch = self._arch
             self.console.warning(
                 f"There is no manylinux base image for {manylinux_arch}"
             )
@@ -202,14 +300,12 @@ class LinuxAppImageCreateCommand(
         try:
             tag = getattr(app, "manylinux_image_tag", "latest")
             context["manylinux_image"] = f"{app.manylinux}_{manylinux_arch}:{tag}"
-            if app.manylinux in {"manylinux1", "manylinux2010", "manylinux2014"}:
-                context["vendor_base"] = "centos"
-            elif app.manylinux == "manylinux_2_24":
-                context["vendor_base"] = "debian"
-            elif app.manylinux.startswith("manylinux_2_"):
-                context["vendor_base"] = "almalinux"
-            else:
+            vendor_base = _VENDOR_BASE.get(app.manylinux)
+            if vendor_base is None and app.manylinux.startswith("manylinux_2_"):
+                vendor_base = "almalinux"
+            if vendor_base is None:
                 raise BriefcaseConfigError(f"Unknown manylinux tag {app.manylinux!r}")
+            context["vendor_base"] = vendor_base
         except AttributeError:
             pass
 
@@ -225,22 +321,7 @@ class LinuxAppImageCreateCommand(
         # On Windows, the support path is co-mingled with app content.
         # This means updating the support package is imperfect.
         # Warn the user that there could be problems.
-        self.console.warning("""
-*************************************************************************
-** WARNING: Support package update may be imperfect                    **
-*************************************************************************
-
-    Support packages in Linux AppImages are overlaid with app content,
-    so it isn't possible to remove all old support files before
-    installing new ones.
-
-    Briefcase will unpack the new support package without cleaning up
-    existing support package content. This *should* work; however,
-    ensure a reproducible release artefacts, it is advisable to
-    perform a clean app build before release.
-
-*************************************************************************
-""")
+        self.console.warning(_SUPPORT_PACKAGE_UPDATE_WARNING)
 
 
 class LinuxAppImageUpdateCommand(LinuxAppImageCreateCommand, UpdateCommand):
@@ -268,11 +349,15 @@ class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
         # Build a dictionary of environment definitions that are required
         env = {}
 
+        # Resolve the paths used by the linuxdeploy invocation once.
+        bundle_path = self.bundle_path(app)
+        appdir_path = self.appdir_path(app)
+
         self.console.info("Checking for Linuxdeploy plugins...", prefix=app.app_name)
         try:
             plugins = self.tools.linuxdeploy.verify_plugins(
                 app.linuxdeploy_plugins,
-                bundle_path=self.bundle_path(app),
+                bundle_path=bundle_path,
             )
 
             self.console.info("Configuring Linuxdeploy plugins...", prefix=app.app_name)
@@ -288,8 +373,10 @@ class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
 
             # Construct a path that has been prepended with the path to the plugins
             env["PATH"] = os.pathsep.join(
-                [os.fsdecode(plugin.file_path) for plugin in plugins.values()]
-                + [base_path]
+                chain(
+                    (os.fsdecode(plugin.file_path) for plugin in plugins.values()),
+                    (base_path,),
+                )
             )
         except AttributeError:
             self.console.info("No linuxdeploy plugins configured.")
@@ -324,26 +411,24 @@ class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
                 # so they can be passed in to linuxdeploy to have their
                 # requirements added to the AppImage. Looks for any .so file
                 # in the application, and make sure it is marked for deployment.
-                so_folders = {
-                    so_file.parent for so_file in self.appdir_path(app).glob("**/*.so")
-                }
+                so_folders = _so_folders(appdir_path)
 
                 additional_args = []
-                for folder in sorted(so_folders):
-                    additional_args.extend(["--deploy-deps-only", str(folder)])
+                for folder in so_folders:
+                    additional_args.extend(["--deploy-deps-only", folder])
 
                 for plugin in plugins:
                     additional_args.extend(["--plugin", plugin])
 
                 # Build the AppImage.
+                linuxdeploy = self.tools.linuxdeploy
                 self.tools[app].app_context.run(
                     [
-                        self.tools.linuxdeploy.file_path
-                        / self.tools.linuxdeploy.file_name,
+                        linuxdeploy.file_path / linuxdeploy.file_name,
                         "--appdir",
-                        self.appdir_path(app),
+                        appdir_path,
                         "--desktop-file",
-                        self.appdir_path(app) / f"{app.bundle_identifier}.desktop",
+                        appdir_path / f"{app.bundle_identifier}.desktop",
                         "--output",
                         "appimage",
                         "-v0" if self.console.is_deep_debug else "-v1",
@@ -351,7 +436,7 @@ class LinuxAppImageBuildCommand(LinuxAppImageMixin, BuildCommand):
                     ],
                     env=env,
                     check=True,
-                    cwd=self.bundle_path(app),
+                    cwd=bundle_path,
                 )
 
                 # Make the binary executable.
@@ -186,6 +186,41 @@ def test_build_appimage(build_command, first_app, debug_mode, tmp_path, sub_stre
     )
 
 
+def test_build_appimage_missing_appdir(
+    build_command,
+    first_app_config,
+    tmp_path,
+    sub_stream_kw,
+):
+    """If the AppDir doesn't exist, no .so folders are passed to linuxdeploy."""
+    build_command.verify_app_tools(first_app_config)
+    build_command.build_app(first_app_config)
+
+    # linuxdeploy was invoked without any --deploy-deps-only arguments
+    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
+    build_command._subprocess.Popen.assert_called_with(
+        [
+            os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
+            "--appdir",
+            os.fsdecode(app_dir),
+            "--desktop-file",
+            os.fsdecode(app_dir / "com.example.first-app.desktop"),
+            "--output",
+            "appimage",
+            "-v1",
+        ],
+        env={
+            "PATH": "/usr/local/bin:/usr/bin:/path/to/somewhere",
+            "LINUXDEPLOY_OUTPUT_VERSION": "0.0.1",
+            "DISABLE_COPYRIGHT_FILES_DEPLOYMENT": "1",
+            "APPIMAGE_EXTRACT_AND_RUN": "1",
+            "ARCH": "x86_64",
+        },
+        cwd=os.fsdecode(tmp_path / "base_path/build/first-app/linux/appimage"),
+        **sub_stream_kw,
+    )
+
+
 @pytest.mark.skipif(
     sys.platform == "win32",
     reason="Windows paths can't be passed to linuxdeploy",
@@ -73,6 +73,19 @@ def test_docker_image_tag(create_command, first_app_config, manylinux, tag):
     assert image_tag == f"briefcase/com.example.first-app:{tag}"
 
 
+def test_docker_image_tag_cached(create_command, first_app_config):
+    """The Docker image tag is computed once per app and cached."""
+    first_app_config.manylinux = "manylinux_2_28"
+
+    image_tag = create_command.docker_image_tag(first_app_config)
+    assert image_tag == "briefcase/com.example.first-app:manylinux_2_28-appimage"
+
+    # A second call returns the cached tag, even if the app config has
+    # (somehow) been modified in the interim.
+    first_app_config.manylinux = "manylinux1"
+    assert create_command.docker_image_tag(first_app_config) == image_tag
+
+
 def test_docker_image_tag_uppercase_name(
     create_command,
     uppercase_app_config,
@@ -227,6 +240,35 @@ def test_verify_non_linux_docker(
     )
 
 
+def test_verify_tools_only_once(create_command, first_app_config, monkeypatch):
+    """Repeated verify_tools() calls only run the tool verifiers once."""
+    create_command.tools.host_os = "Linux"
+    create_command.use_docker = True
+
+    # Mock the LinuxDeploy and Docker verifiers
+    mock_linuxdeploy_verify = MagicMock(spec=LinuxDeploy.verify)
+    monkeypatch.setattr(
+        briefcase.platforms.linux.appimage.LinuxDeploy,
+        "verify",
+        mock_linuxdeploy_verify,
+    )
+    mock_docker_verify = MagicMock(spec=Docker.verify)
+    monkeypatch.setattr(
+        briefcase.platforms.linux.appimage.Docker,
+        "verify",
+        mock_docker_verify,
+    )
+
+    # Verify the tools twice
+    create_command.verify_tools()
+    create_command.verify_tools()
+
+    # Each verifier was only invoked once; the tool cache records the
+    # verifications performed by the first call.
+    mock_linuxdeploy_verify.assert_called_once_with(tools=create_command.tools)
+    mock_docker_verify.assert_called_once_with(tools=create_command.tools)
+
+
 def test_clone_options(dummy_console, tmp_path):
     """Docker options are cloned."""
     build_command = LinuxAppImageBuildCommand(